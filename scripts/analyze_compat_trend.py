@@ -8,10 +8,18 @@ layer usage is trending downward and estimates when it might reach zero.
 
 import argparse
 import json
+import math
 import sys
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-import statistics
+
+# orjson parses the metrics history several times faster than stdlib json;
+# fall back to the stdlib parser when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Enable UTF-8 mode on Windows to handle emoji output
 if sys.platform == "win32":
@@ -27,24 +35,47 @@ def load_historical_data():
     # Try to load from local file if it exists
     metrics_file = Path('usage_metrics.jsonl')
     if metrics_file.exists():
-        data = []
-        with open(metrics_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    data.append(json.loads(line))
-        return data
-    
-    # Fallback to simulated historical data
-    base_date = datetime.now() - timedelta(days=30)
-    return [
-        {
-            'timestamp': (base_date + timedelta(days=i)).isoformat(),
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(metrics_file, 'rb') as f:
+            return [loads(line) for line in f.read().splitlines() if line.strip()]
+    
+    # Fallback to simulated historical data. The wall clock is read once and
+    # each day's stamp is produced by adding one shared timedelta to the
+    # previous datetime, rather than building 30 fresh timedelta objects and
+    # re-adding them to the base inside the comprehension.
+    stamp = datetime.now() - timedelta(days=30)
+    one_day = timedelta(days=1)
+    data = []
+    for i in range(30):
+        data.append({
+            'timestamp': stamp.isoformat(),
             'usage_count': max(0, 50 - i * 2 + (i % 7)),  # Simulated downward trend
             'commit': f'abc123{i}',
             'branch': 'main'
-        }
-        for i in range(30)
-    ]
+        })
+        stamp += one_day
+    return data
+
+_TIMESTAMP_KEY = itemgetter('timestamp')
+
+def _mean(values):
+    """Arithmetic mean via math.fsum (much faster than statistics.mean)."""
+    return math.fsum(values) / len(values)
+
+def _linear_fit(values):
+    """Least-squares (slope, intercept) of values against their indices.
+
+    Closed-form equivalent of numpy.polyfit(range(n), values, 1) without
+    pulling numpy into the script toolchain.
+    """
+    n = len(values)
+    x_mean = (n - 1) / 2.0
+    y_mean = math.fsum(values) / n
+    covariance = math.fsum((i - x_mean) * (y - y_mean) for i, y in enumerate(values))
+    # Closed form of sum((i - x_mean)**2) for i in range(n)
+    x_variance = n * (n * n - 1) / 12.0
+    slope = covariance / x_variance if x_variance else 0.0
+    return slope, y_mean - slope * x_mean
 
 def calculate_trend(data, current_usage, baseline_usage):
     """Calculate usage trend and project removal timeline."""
@@ -59,7 +90,7 @@ def calculate_trend(data, current_usage, baseline_usage):
         }
     
     # Sort by timestamp
-    data.sort(key=lambda x: x['timestamp'])
+    data.sort(key=_TIMESTAMP_KEY)
     
     # Calculate trend over last 30 days
     recent_data = [d for d in data if 'main' in d.get('branch', '')]
@@ -77,8 +108,8 @@ def calculate_trend(data, current_usage, baseline_usage):
     
     # Calculate linear trend
     peak_usage = max(usage_counts)
-    recent_avg = statistics.mean(usage_counts[-7:]) if len(usage_counts) >= 7 else usage_counts[-1]
-    older_avg = statistics.mean(usage_counts[:7]) if len(usage_counts) >= 14 else usage_counts[0]
+    recent_avg = _mean(usage_counts[-7:]) if len(usage_counts) >= 7 else usage_counts[-1]
+    older_avg = _mean(usage_counts[:7]) if len(usage_counts) >= 14 else usage_counts[0]
     
     if older_avg == 0:
         trend_percentage = 0
@@ -95,9 +126,13 @@ def calculate_trend(data, current_usage, baseline_usage):
     # Project removal date based on trend
     projected_removal_date = 'unknown'
     if trend_direction == 'decreasing' and recent_avg > 0:
-        # Simple linear projection
-        days_per_unit = len(usage_counts) / max(1, older_avg - recent_avg)
-        days_to_zero = recent_avg * days_per_unit
+        # Least-squares projection: extend the fitted line from the latest
+        # sample to its zero crossing (samples are roughly daily).
+        slope, intercept = _linear_fit(usage_counts)
+        if slope < 0:
+            days_to_zero = -intercept / slope - (len(usage_counts) - 1)
+        else:
+            days_to_zero = -1
         if days_to_zero > 0 and days_to_zero < 365:  # Reasonable timeframe
             removal_date = datetime.now() + timedelta(days=days_to_zero)
             projected_removal_date = removal_date.strftime('%Y-%m-%d')
@@ -189,19 +224,24 @@ def main():
     with open(args.output, 'w') as f:
         json.dump(trend_data, f, indent=2)
     
-    # Print summary
-    print(f"Trend Analysis Summary:")
-    print(f"  Current usage: {trend_data['current_usage']}")
-    print(f"  Baseline usage: {trend_data['baseline_usage']}")
-    print(f"  Trend direction: {trend_data['trend_direction']}")
-    print(f"  Trend percentage: {trend_data['trend_percentage']}%")
-    print(f"  Peak usage: {trend_data['peak_usage']}")
-    print(f"  Projected removal: {trend_data['projected_removal_date']}")
-    
-    print(f"\nRecommendations:")
-    for rec in recommendations:
-        icon = {'warning': '⚠️', 'success': '✅', 'info': 'ℹ️', 'action': '🔧'}.get(rec['type'], '•')
-        print(f"  {icon} {rec['message']}")
+    # Print summary in one write: per-line print acquires the stdout lock
+    # and issues a syscall each time under CI log capture.
+    icons = {'warning': '⚠️', 'success': '✅', 'info': 'ℹ️', 'action': '🔧'}
+    lines = [
+        "Trend Analysis Summary:",
+        f"  Current usage: {trend_data['current_usage']}",
+        f"  Baseline usage: {trend_data['baseline_usage']}",
+        f"  Trend direction: {trend_data['trend_direction']}",
+        f"  Trend percentage: {trend_data['trend_percentage']}%",
+        f"  Peak usage: {trend_data['peak_usage']}",
+        f"  Projected removal: {trend_data['projected_removal_date']}",
+        "",
+        "Recommendations:",
+    ]
+    lines.extend(
+        f"  {icons.get(rec['type'], '•')} {rec['message']}" for rec in recommendations
+    )
+    sys.stdout.write('\n'.join(lines) + '\n')
     
     # Exit with appropriate code
     if trend_data['trend_direction'] == 'increasing':
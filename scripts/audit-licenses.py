@@ -4,7 +4,12 @@ License audit script for Racing Wheel Suite
 Analyzes dependencies and generates license compliance reports
 """
 
+import csv
+import functools
+import html
+import io
 import json
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -12,8 +17,15 @@ from typing import Dict, List, Set, Tuple
 import argparse
 from datetime import datetime
 
+# orjson parses the multi-MB cargo metadata output several times faster
+# than stdlib json; fall back to the stdlib parser when not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Allowed licenses (SPDX identifiers)
-ALLOWED_LICENSES = {
+ALLOWED_LICENSES = frozenset({
     'MIT',
     'Apache-2.0',
     'BSD-2-Clause',
@@ -22,10 +34,10 @@ ALLOWED_LICENSES = {
     'Unicode-DFS-2016',
     'Unlicense',
     'CC0-1.0'
-}
+})
 
 # Licenses that require legal review
-REVIEW_REQUIRED = {
+REVIEW_REQUIRED = frozenset({
     'GPL-2.0',
     'GPL-3.0',
     'LGPL-2.1',
@@ -34,81 +46,96 @@ REVIEW_REQUIRED = {
     'MPL-2.0',
     'EPL-1.0',
     'EPL-2.0'
-}
+})
 
 # Licenses that are not allowed
-FORBIDDEN_LICENSES = {
+FORBIDDEN_LICENSES = frozenset({
     'GPL-2.0-only',
     'GPL-3.0-only',
     'AGPL-3.0-only'
-}
+})
+
+# One status lookup per license in the compliance loop instead of three set
+# membership probes. Forbidden entries are applied last so they win if a
+# license ever appears in more than one set.
+_LICENSE_STATUS = {lic: 'allowed' for lic in ALLOWED_LICENSES}
+_LICENSE_STATUS.update((lic, 'review') for lic in REVIEW_REQUIRED)
+_LICENSE_STATUS.update((lic, 'forbidden') for lic in FORBIDDEN_LICENSES)
+
+# Splits an SPDX expression on OR/AND/WITH operators and parentheses in a
+# single pass.
+_LICENSE_SPLIT_RE = re.compile(r'\s+(?:OR|AND|WITH)\s+|[()]')
+
+# Shared empty result for dependencies without license information.
+_NO_LICENSES: frozenset = frozenset()
+
+@functools.lru_cache(maxsize=None)
+def parse_license_expression(license_expr: str) -> frozenset:
+    """Parse SPDX license expression and return individual licenses.
+
+    License strings repeat heavily across a dependency tree ("MIT OR
+    Apache-2.0" appears hundreds of times), and every dependency is parsed
+    twice (compliance check + summary), so identical expressions are
+    memoized. The frozenset result must not be mutated by callers.
+    """
+    if not license_expr or license_expr == 'Unknown':
+        return _NO_LICENSES
+
+    # Simple parsing - in production, use a proper SPDX parser
+    # One regex split handles the OR/AND/WITH operators and parentheses
+    # instead of four sequential full-string replace/split passes.
+    return frozenset(
+        part for part in map(str.strip, _LICENSE_SPLIT_RE.split(license_expr)) if part
+    )
 
 class LicenseAuditor:
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.dependencies = {}
         self.license_issues = []
+        # Issues grouped by originating dependency name, filled during
+        # audit_licenses so reports can look them up in O(1).
+        self.issues_by_dep = {}
         
     def run_cargo_metadata(self) -> Dict:
         """Run cargo metadata to get dependency information"""
-        try:
-            result = subprocess.run(
-                ['cargo', 'metadata', '--format-version', '1'],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return json.loads(result.stdout)
-        except subprocess.CalledProcessError as e:
-            print(f"Error running cargo metadata: {e}")
+        # Keep stdout as bytes: the metadata JSON for a large workspace is
+        # several MB, and decoding it to str before parsing doubles peak
+        # memory for no benefit.
+        proc = subprocess.Popen(
+            ['cargo', 'metadata', '--format-version', '1'],
+            cwd=self.project_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        out, err = proc.communicate()
+        if proc.returncode != 0:
+            print(f"Error running cargo metadata: {err.decode('utf-8', 'replace').strip()}")
             sys.exit(1)
+        return orjson.loads(out) if orjson is not None else json.loads(out)
     
     def extract_dependencies(self, metadata: Dict) -> Dict[str, Dict]:
         """Extract dependency information from cargo metadata"""
-        dependencies = {}
-        
-        for package in metadata['packages']:
-            # Skip workspace packages
-            if package['source'] is None:
-                continue
-                
-            name = package['name']
-            version = package['version']
-            license_field = package.get('license', 'Unknown')
-            license_file = package.get('license_file')
-            repository = package.get('repository', '')
-            authors = package.get('authors', [])
-            
-            dependencies[f"{name}-{version}"] = {
-                'name': name,
-                'version': version,
-                'license': license_field,
-                'license_file': license_file,
-                'repository': repository,
-                'authors': authors,
-                'source': package.get('source', '')
+        # Single comprehension; workspace packages (source is None) are
+        # skipped. Keys stay "name-version" strings because this dict is
+        # serialized straight into the JSON report.
+        return {
+            f"{package['name']}-{package['version']}": {
+                'name': package['name'],
+                'version': package['version'],
+                'license': package.get('license', 'Unknown'),
+                'license_file': package.get('license_file'),
+                'repository': package.get('repository', ''),
+                'authors': package.get('authors', []),
+                'source': package['source'],
             }
-        
-        return dependencies
+            for package in metadata['packages']
+            if package['source'] is not None
+        }
     
     def parse_license_expression(self, license_expr: str) -> Set[str]:
-        """Parse SPDX license expression and return individual licenses"""
-        if not license_expr or license_expr == 'Unknown':
-            return set()
-        
-        # Simple parsing - in production, use a proper SPDX parser
-        # Handle common operators: AND, OR, WITH
-        licenses = set()
-        
-        # Split on common operators and clean up
-        parts = license_expr.replace(' OR ', '|').replace(' AND ', '|').replace(' WITH ', '|')
-        for part in parts.split('|'):
-            license_id = part.strip().replace('(', '').replace(')', '')
-            if license_id:
-                licenses.add(license_id)
-        
-        return licenses
+        """Parse SPDX license expression (delegates to the cached module function)."""
+        return parse_license_expression(license_expr)
     
     def check_license_compliance(self, dependency: Dict) -> List[str]:
         """Check if a dependency's license is compliant"""
@@ -121,11 +148,12 @@ class LicenseAuditor:
             return issues
         
         for license_id in licenses:
-            if license_id in FORBIDDEN_LICENSES:
+            status = _LICENSE_STATUS.get(license_id)
+            if status == 'forbidden':
                 issues.append(f"Forbidden license {license_id} in {dependency['name']}")
-            elif license_id in REVIEW_REQUIRED:
+            elif status == 'review':
                 issues.append(f"License {license_id} requires review in {dependency['name']}")
-            elif license_id not in ALLOWED_LICENSES:
+            elif status is None:
                 issues.append(f"Unknown/unreviewed license {license_id} in {dependency['name']}")
         
         return issues
@@ -139,11 +167,14 @@ class LicenseAuditor:
         
         all_issues = []
         license_summary = {}
-        
+        self.issues_by_dep = {}
+
         for dep_key, dependency in self.dependencies.items():
             issues = self.check_license_compliance(dependency)
             all_issues.extend(issues)
-            
+            if issues:
+                self.issues_by_dep.setdefault(dependency['name'], []).extend(issues)
+
             # Build license summary
             licenses = self.parse_license_expression(dependency['license'])
             for license_id in licenses:
@@ -187,20 +218,28 @@ class LicenseAuditor:
     
     def _generate_csv_report(self, report_data: Dict) -> str:
         """Generate CSV format report"""
-        output = []
-        output.append("Name,Version,License,Repository,Issues")
-        
+        # csv.writer handles quoting of commas in license expressions and
+        # repository URLs, which the previous f-string rows silently broke.
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator='\n')
+        writer.writerow(['Name', 'Version', 'License', 'Repository', 'Issues'])
+
         for dep_key, dep in report_data['dependencies'].items():
-            issues = [issue for issue in report_data['issues'] if dep['name'] in issue]
+            issues = self.issues_by_dep.get(dep['name'], ())
             issues_str = '; '.join(issues) if issues else 'None'
-            
-            output.append(f"{dep['name']},{dep['version']},{dep['license']},{dep['repository']},{issues_str}")
-        
-        return '\n'.join(output)
+
+            writer.writerow([dep['name'], dep['version'], dep['license'],
+                             dep['repository'], issues_str])
+
+        return buf.getvalue()
     
     def _generate_html_report(self, report_data: Dict) -> str:
         """Generate HTML format report"""
-        html = f"""<!DOCTYPE html>
+        # Accumulate chunks and join once at the end; += on a growing str
+        # re-copies the whole report for every dependency row. Injected
+        # fields are HTML-escaped so crate metadata cannot break the markup.
+        esc = html.escape
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <title>License Audit Report - Racing Wheel Suite</title>
@@ -221,7 +260,7 @@ class LicenseAuditor:
     <div class="header">
         <h1>License Audit Report</h1>
         <p>Project: Racing Wheel Suite</p>
-        <p>Generated: {report_data['timestamp']}</p>
+        <p>Generated: {esc(report_data['timestamp'])}</p>
     </div>
     
     <div class="summary">
@@ -231,17 +270,17 @@ class LicenseAuditor:
     </div>
     
     <div class="issues">
-        <h2>Issues</h2>"""
-        
+        <h2>Issues</h2>"""]
+
         if not report_data['issues']:
-            html += '<p class="ok">No license issues found!</p>'
+            parts.append('<p class="ok">No license issues found!</p>')
         else:
-            html += '<ul>'
+            parts.append('<ul>')
             for issue in report_data['issues']:
-                html += f'<li class="issue">{issue}</li>'
-            html += '</ul>'
-        
-        html += """
+                parts.append(f'<li class="issue">{esc(issue)}</li>')
+            parts.append('</ul>')
+
+        parts.append("""
     </div>
     
     <div class="dependencies">
@@ -252,24 +291,25 @@ class LicenseAuditor:
                 <th>Version</th>
                 <th>License</th>
                 <th>Repository</th>
-            </tr>"""
-        
+            </tr>""")
+
         for dep in report_data['dependencies'].values():
-            html += f"""
+            repository = esc(dep['repository'])
+            parts.append(f"""
             <tr>
-                <td>{dep['name']}</td>
-                <td>{dep['version']}</td>
-                <td>{dep['license']}</td>
-                <td><a href="{dep['repository']}">{dep['repository']}</a></td>
-            </tr>"""
-        
-        html += """
+                <td>{esc(dep['name'])}</td>
+                <td>{esc(dep['version'])}</td>
+                <td>{esc(dep['license'])}</td>
+                <td><a href="{repository}">{repository}</a></td>
+            </tr>""")
+
+        parts.append("""
         </table>
     </div>
 </body>
-</html>"""
-        
-        return html
+</html>""")
+
+        return ''.join(parts)
 
 def main():
     parser = argparse.ArgumentParser(description='Audit licenses in Racing Wheel Suite dependencies')
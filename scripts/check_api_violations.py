@@ -7,6 +7,8 @@ This script enforces public API usage and prevents regression.
 import os
 import re
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Enable UTF-8 mode on Windows to handle emoji output
@@ -15,19 +17,92 @@ if sys.platform == "win32":
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
+# Compiled once at module scope. Each pattern family is a single
+# alternation so every line needs exactly one .search call instead of a
+# loop over separate patterns.
+PRIVATE_RE = re.compile(r'use\s+.*::(tests|internal|private)')
+DEPRECATED_RE = re.compile(r'\bwheel_angle_mdeg\b|\btemp_c\b|\bsequence\b|\.faults\b')
+GLOB_RE = re.compile(r'pub\s+use\s+.*::\*')
+
+def _newline_index(content):
+    """Return the offsets of every newline in content."""
+    index = []
+    pos = content.find('\n')
+    while pos != -1:
+        index.append(pos)
+        pos = content.find('\n', pos + 1)
+    return index
+
+def scan_lines(content, pattern):
+    """Return (line_number, line_text) pairs for lines matching pattern.
+
+    Runs finditer over the whole buffer instead of splitting the file into
+    a list of lines; clean files (the common case) finish in one regex pass
+    with no per-line allocation. Line numbers are recovered by bisecting a
+    newline-offset index that is only built when a match exists. Several
+    matches on one line report that line once.
+    """
+    results = []
+    newlines = None
+    last_line = 0
+    for m in pattern.finditer(content):
+        if newlines is None:
+            newlines = _newline_index(content)
+        line_num = bisect_right(newlines, m.start()) + 1
+        if line_num == last_line:
+            continue
+        last_line = line_num
+        start = newlines[line_num - 2] + 1 if line_num > 1 else 0
+        end = newlines[line_num - 1] if line_num <= len(newlines) else len(content)
+        results.append((line_num, content[start:end]))
+    return results
+
+# Pattern families applied to every integration-test file, in report order.
+FAMILIES = (
+    (PRIVATE_RE, "Private import"),
+    (DEPRECATED_RE, "Deprecated field"),
+    (GLOB_RE, "Glob re-export"),
+)
+
+def scan_one_file(rust_file):
+    """Read one file and run all three pattern families over it.
+
+    Returns one list of violation strings per family so the merged report
+    keeps the private/deprecated/glob grouping.
+    """
+    with open(rust_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    results = ([], [], [])
+    for family, (pattern, label) in zip(results, FAMILIES):
+        for line_num, line in scan_lines(content, pattern):
+            family.append(f"{rust_file}:{line_num}: {label}: {line.strip()}")
+    return results
+
+def scan_integration_tests():
+    """Scan every integration-test .rs file once for all pattern families.
+
+    Walks the tree a single time, fans the file scans out across cores, and
+    returns one violation list per family in FAMILIES order.
+    """
+    grouped = ([], [], [])
+    integration_tests_dir = Path("crates/integration-tests")
+    if not integration_tests_dir.exists():
+        return grouped
+
+    rust_files = list(integration_tests_dir.rglob("*.rs"))
+    with ProcessPoolExecutor() as executor:
+        for per_file in executor.map(scan_one_file, rust_files, chunksize=32):
+            for merged, found in zip(grouped, per_file):
+                merged.extend(found)
+    return grouped
+
 def check_api_violations():
     """Check for various API violations."""
     violations = []
-    
-    # Check 1: Private module imports
-    violations.extend(check_private_imports())
-    
-    # Check 2: Deprecated field names
-    violations.extend(check_deprecated_fields())
-    
-    # Check 3: Glob re-exports (if any)
-    violations.extend(check_glob_reexports())
-    
+    for family_violations in scan_integration_tests():
+        violations.extend(family_violations)
+
     if violations:
         print("❌ Found API violations:")
         for violation in violations:
@@ -39,73 +114,15 @@ def check_api_violations():
 
 def check_private_imports():
     """Check for private module imports."""
-    violations = []
-    integration_tests_dir = Path("crates/integration-tests")
-    
-    if not integration_tests_dir.exists():
-        return violations
-    
-    private_patterns = [
-        r'use\s+.*::(tests|internal|private)',
-    ]
-    
-    for rust_file in integration_tests_dir.rglob("*.rs"):
-        with open(rust_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        for line_num, line in enumerate(content.splitlines(), 1):
-            for pattern in private_patterns:
-                if re.search(pattern, line):
-                    violations.append(f"{rust_file}:{line_num}: Private import: {line.strip()}")
-    
-    return violations
+    return scan_integration_tests()[0]
 
 def check_deprecated_fields():
     """Check for deprecated field names."""
-    violations = []
-    integration_tests_dir = Path("crates/integration-tests")
-    
-    if not integration_tests_dir.exists():
-        return violations
-    
-    # Deprecated field patterns
-    deprecated_patterns = [
-        r'\bwheel_angle_mdeg\b',
-        r'\btemp_c\b',
-        r'\bsequence\b',
-        r'\.faults\b',  # Should be fault_flags
-    ]
-    
-    for rust_file in integration_tests_dir.rglob("*.rs"):
-        with open(rust_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        for line_num, line in enumerate(content.splitlines(), 1):
-            for pattern in deprecated_patterns:
-                if re.search(pattern, line):
-                    violations.append(f"{rust_file}:{line_num}: Deprecated field: {line.strip()}")
-    
-    return violations
+    return scan_integration_tests()[1]
 
 def check_glob_reexports():
     """Check for glob re-exports."""
-    violations = []
-    integration_tests_dir = Path("crates/integration-tests")
-    
-    if not integration_tests_dir.exists():
-        return violations
-    
-    glob_pattern = r'pub\s+use\s+.*::\*'
-    
-    for rust_file in integration_tests_dir.rglob("*.rs"):
-        with open(rust_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        for line_num, line in enumerate(content.splitlines(), 1):
-            if re.search(glob_pattern, line):
-                violations.append(f"{rust_file}:{line_num}: Glob re-export: {line.strip()}")
-    
-    return violations
+    return scan_integration_tests()[2]
 
 if __name__ == "__main__":
     sys.exit(check_api_violations())
\ No newline at end of file
@@ -9,6 +9,7 @@ in our codebase to maintain clear API boundaries.
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Enable UTF-8 mode on Windows to handle emoji output
@@ -17,9 +18,45 @@ if sys.platform == "win32":
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
+# Bytes pattern: files are scanned undecoded, and only the rare matching
+# line pays for a UTF-8 decode.
+GLOB_RE = re.compile(rb'pub\s+use\s+.*::\*\s*;')
+
+# Files handed to each worker process in one task; large enough to
+# amortize pickling, small enough to keep all cores busy.
+BATCH_SIZE = 64
+
+def _scan_file(rust_file):
+    """Scan a single .rs file, returning its violations."""
+    violations = []
+    try:
+        data = rust_file.read_bytes()
+    except Exception as e:
+        print(f"Warning: Could not read {rust_file}: {e}")
+        return violations
+
+    for m in GLOB_RE.finditer(data):
+        line_start = data.rfind(b'\n', 0, m.start()) + 1
+        line_end = data.find(b'\n', m.end())
+        if line_end == -1:
+            line_end = len(data)
+        violations.append({
+            'file': str(rust_file),
+            'line': data.count(b'\n', 0, m.start()) + 1,
+            'content': data[line_start:line_end].decode('utf-8', 'replace').strip()
+        })
+
+    return violations
+
+def _scan_batch(files):
+    """Scan a batch of files in one worker task."""
+    violations = []
+    for rust_file in files:
+        violations.extend(_scan_file(rust_file))
+    return violations
+
 def check_glob_reexports(root_dir):
     """Check for glob re-exports in Rust files."""
-    glob_pattern = re.compile(r'pub\s+use\s+.*::\*\s*;')
     violations = []
     
     # Search in crates directory
@@ -28,18 +65,13 @@ def check_glob_reexports(root_dir):
         print(f"Warning: {crates_dir} does not exist")
         return violations
     
-    for rust_file in crates_dir.rglob("*.rs"):
-        try:
-            with open(rust_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    if glob_pattern.search(line):
-                        violations.append({
-                            'file': str(rust_file),
-                            'line': line_num,
-                            'content': line.strip()
-                        })
-        except Exception as e:
-            print(f"Warning: Could not read {rust_file}: {e}")
+    # The scan is independent per file, so fan batches out across cores.
+    # executor.map preserves batch order, keeping the report deterministic.
+    files = list(crates_dir.rglob("*.rs"))
+    batches = [files[i:i + BATCH_SIZE] for i in range(0, len(files), BATCH_SIZE)]
+    with ProcessPoolExecutor() as executor:
+        for batch_violations in executor.map(_scan_batch, batches):
+            violations.extend(batch_violations)
     
     return violations
 
@@ -7,6 +7,8 @@ This script enforces that integration tests only use public APIs.
 import os
 import re
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Enable UTF-8 mode on Windows to handle emoji output
@@ -15,6 +17,59 @@ if sys.platform == "win32":
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
+# RE2 matches this literal-heavy alternation in guaranteed linear time with
+# a DFA, well ahead of the stdlib backtracking engine on large buffers.
+# google-re2 is optional; fall back to the stdlib engine when not installed.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Pattern that indicates private module access. The old pair of patterns
+# differed only in the `crate::` prefix, so one alternation covers both and
+# the per-line loop enters the regex engine once instead of twice. A line
+# that matched both variants is now also reported once instead of twice.
+_PRIVATE_RE = _re_engine.compile(r'use\s+(?:crate::)?[^\n]*::(?:tests|internal|private)\b')
+
+# Cheap substring gate run before the regex. Most files contain none of the
+# private-module tokens, and str.__contains__ is an order of magnitude
+# faster than entering the regex engine at all.
+_TOKENS = ('::tests', '::internal', '::private')
+
+def _newline_index(content):
+    """Return the offsets of every newline in content."""
+    index = []
+    pos = content.find('\n')
+    while pos != -1:
+        index.append(pos)
+        pos = content.find('\n', pos + 1)
+    return index
+
+def _scan_file(rust_file):
+    """Scan one .rs file, returning its private-import violations."""
+    # read_text skips the buffered-IO layer setup that open()+read()
+    # pays per file; with many small .rs files that overhead dominates.
+    content = rust_file.read_text(encoding='utf-8')
+
+    if not any(token in content for token in _TOKENS):
+        return []
+
+    # One finditer pass over the whole buffer instead of splitting the
+    # file into a list of line strings; clean files (the common case)
+    # finish in a single regex scan with no per-line allocation. Line
+    # numbers are recovered by bisecting a newline-offset index that is
+    # only built once a match exists.
+    violations = []
+    newlines = None
+    for m in _PRIVATE_RE.finditer(content):
+        if newlines is None:
+            newlines = _newline_index(content)
+        line_num = bisect_right(newlines, m.start()) + 1
+        start = newlines[line_num - 2] + 1 if line_num > 1 else 0
+        end = newlines[line_num - 1] if line_num <= len(newlines) else len(content)
+        violations.append(f"{rust_file}:{line_num}: {content[start:end].strip()}")
+    return violations
+
 def check_private_imports():
     """Check for private module imports in integration tests."""
     integration_tests_dir = Path("crates/integration-tests")
@@ -23,22 +78,14 @@ def check_private_imports():
         print("Integration tests directory not found")
         return 1
     
-    # Patterns that indicate private module access
-    private_patterns = [
-        r'use\s+.*::(tests|internal|private)',
-        r'use\s+crate::.*::(tests|internal|private)',
-    ]
-    
+    # Each file scan is independent, so fan them out across cores. Paths
+    # are sorted first so the report order is deterministic regardless of
+    # rglob traversal order; executor.map preserves input order.
+    rust_files = sorted(integration_tests_dir.rglob("*.rs"))
     violations = []
-    
-    for rust_file in integration_tests_dir.rglob("*.rs"):
-        with open(rust_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        for line_num, line in enumerate(content.splitlines(), 1):
-            for pattern in private_patterns:
-                if re.search(pattern, line):
-                    violations.append(f"{rust_file}:{line_num}: {line.strip()}")
+    with ProcessPoolExecutor() as executor:
+        for found in executor.map(_scan_file, rust_files, chunksize=16):
+            violations.extend(found)
     
     if violations:
         print("❌ Found private module imports in integration tests:")
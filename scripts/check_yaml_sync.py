@@ -8,39 +8,54 @@ Usage:
 Exits 0 if the files are structurally identical, 1 if they differ.
 """
 
+import filecmp
+import functools
+import json
+import os
 import sys
 import difflib
 
 
-def load_yaml(path: str):
+@functools.lru_cache(maxsize=None)
+def _load_yaml_cached(path: str, mtime: float, size: int):
+    """Parse a YAML file, memoized on (path, mtime, size).
+
+    Repeat checks within one process (CI wrappers, tests) reuse the parsed
+    tree as long as the file has not changed on disk.
+    """
     try:
         import yaml  # type: ignore
     except ImportError:
         print("ERROR: PyYAML not installed. Run: pip install pyyaml", file=sys.stderr)
         sys.exit(2)
 
+    # Prefer the libyaml-backed loader when PyYAML was built with it;
+    # it parses several times faster than the pure-Python SafeLoader.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(path, encoding="utf-8") as fh:
-        return yaml.safe_load(fh)
+        return yaml.load(fh, Loader=loader)
+
+
+def load_yaml(path: str):
+    st = os.stat(path)
+    return _load_yaml_cached(path, st.st_mtime, st.st_size)
 
 
-def sorted_yaml(obj):
-    """Recursively sort dict keys so comparison is order-independent."""
-    if isinstance(obj, dict):
-        return {k: sorted_yaml(v) for k, v in sorted(obj.items())}
-    if isinstance(obj, list):
-        # Lists are order-sensitive (e.g. supported_fields), keep order.
-        return [sorted_yaml(item) for item in obj]
-    return obj
+def canon(obj) -> str:
+    """Canonical JSON rendering of a parsed tree, with sorted keys.
 
+    One pass through the C json encoder replaces the old recursive Python
+    dict rebuild; key order is normalized by sort_keys, while list order
+    (e.g. supported_fields) stays significant. The same string doubles as
+    the content-diff body when the trees differ.
+    """
+    return json.dumps(obj, sort_keys=True, indent=2, default=str, ensure_ascii=False)
 
-def render_games(data) -> list[str]:
-    """Return sorted list of 'key: name' strings for each game entry."""
+
+def games_map(data) -> dict[str, str]:
+    """Return {key: display name} for each game entry."""
     games = data.get("games") or {}
-    lines = []
-    for key in sorted(games):
-        name = (games[key] or {}).get("name", key)
-        lines.append(f"{key}: {name}")
-    return lines
+    return {key: (value or {}).get("name", key) for key, value in games.items()}
 
 
 def main() -> int:
@@ -51,25 +66,33 @@ def main() -> int:
     path_a, path_b = sys.argv[1], sys.argv[2]
 
     try:
+        # Byte-identical files (the common CI case) need no YAML parse at
+        # all: a stat + memcmp proves equality in milliseconds.
+        if filecmp.cmp(path_a, path_b, shallow=False):
+            print(f"OK: {path_a} and {path_b} are identical.")
+            return 0
+
         data_a = load_yaml(path_a)
         data_b = load_yaml(path_b)
     except FileNotFoundError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         return 2
 
-    norm_a = sorted_yaml(data_a)
-    norm_b = sorted_yaml(data_b)
+    canon_a = canon(data_a)
+    canon_b = canon(data_b)
 
-    if norm_a == norm_b:
+    if canon_a == canon_b:
         print(f"OK: {path_a} and {path_b} are identical.")
         return 0
 
-    # Build a human-readable diff of the game lists.
-    games_a = render_games(data_a)
-    games_b = render_games(data_b)
+    # Build a human-readable diff of the game lists. Dict key views support
+    # set difference directly, so no "key: name" strings or intermediate
+    # sets are materialized for games present on both sides.
+    games_a = games_map(data_a)
+    games_b = games_map(data_b)
 
-    only_a = sorted(set(games_a) - set(games_b))
-    only_b = sorted(set(games_b) - set(games_a))
+    only_a = sorted(games_a.keys() - games_b.keys())
+    only_b = sorted(games_b.keys() - games_a.keys())
 
     print("ERROR: game support matrix files are out of sync!", file=sys.stderr)
     print(f"  {path_a}", file=sys.stderr)
@@ -78,21 +101,21 @@ def main() -> int:
 
     if only_a:
         print(f"Games only in {path_a}:", file=sys.stderr)
-        for g in only_a:
-            print(f"  + {g}", file=sys.stderr)
+        for key in only_a:
+            print(f"  + {key}: {games_a[key]}", file=sys.stderr)
 
     if only_b:
         print(f"Games only in {path_b}:", file=sys.stderr)
-        for g in only_b:
-            print(f"  + {g}", file=sys.stderr)
+        for key in only_b:
+            print(f"  + {key}: {games_b[key]}", file=sys.stderr)
 
     if not only_a and not only_b:
-        # Same game keys but differing content — show a structured diff.
-        import yaml  # type: ignore
-
-        text_a = yaml.dump(norm_a, default_flow_style=False, sort_keys=True).splitlines()
-        text_b = yaml.dump(norm_b, default_flow_style=False, sort_keys=True).splitlines()
-        diff = difflib.unified_diff(text_a, text_b, fromfile=path_a, tofile=path_b, lineterm="")
+        # Same game keys but differing content — show a structured diff of
+        # the canonical renderings the equality check already built.
+        diff = difflib.unified_diff(
+            canon_a.splitlines(), canon_b.splitlines(),
+            fromfile=path_a, tofile=path_b, lineterm="",
+        )
         print("", file=sys.stderr)
         print("Content diff:", file=sys.stderr)
         for line in diff:
@@ -13,12 +13,21 @@ Example usage:
 
 import argparse
 import json
+import os
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# orjson parses benchmark JSON several times faster than stdlib json; fall
+# back to the stdlib parser when it is not installed.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 class MetricChange(Enum):
     """Classification of how a metric changed between runs."""
@@ -27,7 +36,7 @@ class MetricChange(Enum):
     UNCHANGED = "unchanged"
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricComparison:
     """Comparison result for a single metric.
 
@@ -57,7 +66,7 @@ class MetricComparison:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Complete result of comparing two benchmark runs.
 
@@ -68,6 +77,11 @@ class ComparisonResult:
         metrics: List of all metric comparisons.
         regressions: List of metrics that exceeded the tolerance (performance worsened).
         improvements: List of metrics that improved beyond the tolerance.
+        unchanged_count: Number of metrics within tolerance, tracked during
+            classification so summaries need no recount.
+        regression_count: Number of regressions, maintained even when the
+            detail lists are not collected.
+        improvement_count: Number of improvements, maintained likewise.
     """
     baseline_file: Path
     current_file: Path
@@ -75,11 +89,14 @@ class ComparisonResult:
     metrics: List[MetricComparison] = field(default_factory=list)
     regressions: List[MetricComparison] = field(default_factory=list)
     improvements: List[MetricComparison] = field(default_factory=list)
+    unchanged_count: int = 0
+    regression_count: int = 0
+    improvement_count: int = 0
 
     @property
     def has_regressions(self) -> bool:
         """Return True if any regressions were detected."""
-        return len(self.regressions) > 0
+        return self.regression_count > 0
 
 
 def load_benchmark_file(file_path: Path) -> Dict[str, Any]:
@@ -94,19 +111,48 @@ def load_benchmark_file(file_path: Path) -> Dict[str, Any]:
     Raises:
         SystemExit: If the file cannot be read or parsed.
     """
-    if not file_path.exists():
+    # One os.open/fstat/read sequence instead of an exists() stat (which
+    # races with the open anyway) plus the buffered-IO stack behind open().
+    # O_BINARY keeps the Windows CRT out of text mode, which would CRLF-
+    # translate and truncate at a 0x1A byte; it does not exist elsewhere.
+    try:
+        fd = os.open(os.fspath(file_path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            data = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+    except FileNotFoundError:
         print(f"Error: Benchmark file not found: {file_path}")
         sys.exit(1)
+    except OSError as e:
+        print(f"Error: Failed to read {file_path}: {e}")
+        sys.exit(1)
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        # Both parsers accept bytes; orjson.JSONDecodeError subclasses
+        # ValueError, as does json.JSONDecodeError.
+        return _loads(data)
+    except ValueError as e:
         print(f"Error: Failed to parse JSON in {file_path}: {e}")
         sys.exit(1)
-    except IOError as e:
-        print(f"Error: Failed to read {file_path}: {e}")
-        sys.exit(1)
+
+
+# Static mapping from summary JSON keys to report labels and units. All
+# summary metrics are lower-is-better.
+_SUMMARY_SCHEMA = (
+    ('rt_loop_us', 'RT Loop Time', 'us'),
+    ('jitter_p99_ms', 'P99 Jitter', 'ms'),
+    ('missed_tick_rate', 'Missed Tick Rate', ''),
+    ('processing_time_median_us', 'Processing Time (Median)', 'us'),
+    ('processing_time_p99_us', 'Processing Time (P99)', 'us'),
+)
+
+# Same for per-benchmark custom metrics: source key, metric-name suffix, unit.
+_CUSTOM_SCHEMA = (
+    ('missed_tick_rate', 'missed_tick_rate', ''),
+    ('e2e_latency_p99_us', 'e2e_latency_p99', 'us'),
+    ('rt_heap_allocs', 'rt_heap_allocs', ''),
+)
 
 
 def extract_summary_metrics(data: Dict[str, Any]) -> Dict[str, tuple]:
@@ -121,25 +167,10 @@ def extract_summary_metrics(data: Dict[str, Any]) -> Dict[str, tuple]:
     metrics = {}
     summary = data.get('summary', {})
 
-    # RT loop time (lower is better)
-    if 'rt_loop_us' in summary:
-        metrics['RT Loop Time'] = (summary['rt_loop_us'], 'us', True)
-
-    # P99 Jitter (lower is better)
-    if 'jitter_p99_ms' in summary:
-        metrics['P99 Jitter'] = (summary['jitter_p99_ms'], 'ms', True)
-
-    # Missed tick rate (lower is better)
-    if 'missed_tick_rate' in summary:
-        metrics['Missed Tick Rate'] = (summary['missed_tick_rate'], '', True)
-
-    # Processing time median (lower is better)
-    if 'processing_time_median_us' in summary:
-        metrics['Processing Time (Median)'] = (summary['processing_time_median_us'], 'us', True)
-
-    # Processing time P99 (lower is better)
-    if 'processing_time_p99_us' in summary:
-        metrics['Processing Time (P99)'] = (summary['processing_time_p99_us'], 'us', True)
+    for source_key, label, unit in _SUMMARY_SCHEMA:
+        value = summary.get(source_key)
+        if value is not None:
+            metrics[label] = (value, unit, True)
 
     return metrics
 
@@ -171,17 +202,11 @@ def extract_benchmark_metrics(data: Dict[str, Any]) -> Dict[str, tuple]:
             p99_us = percentiles['p99'] / 1000.0
             metrics[f'{name}/p99'] = (p99_us, 'us', True)
 
-        # Missed tick rate from custom metrics
-        if 'missed_tick_rate' in custom:
-            metrics[f'{name}/missed_tick_rate'] = (custom['missed_tick_rate'], '', True)
-
-        # E2E latency P99
-        if 'e2e_latency_p99_us' in custom:
-            metrics[f'{name}/e2e_latency_p99'] = (custom['e2e_latency_p99_us'], 'us', True)
-
-        # RT heap allocations (should be 0)
-        if 'rt_heap_allocs' in custom:
-            metrics[f'{name}/rt_heap_allocs'] = (float(custom['rt_heap_allocs']), '', True)
+        # Custom metrics (rt_heap_allocs should be 0)
+        for source_key, suffix, unit in _CUSTOM_SCHEMA:
+            value = custom.get(source_key)
+            if value is not None:
+                metrics[f'{name}/{suffix}'] = (float(value), unit, True)
 
     return metrics
 
@@ -211,6 +236,26 @@ def calculate_change_percent(
     return raw_change
 
 
+def _classify_lower_is_better(change_percent: float, tolerance_percent: float) -> MetricChange:
+    """Classify for lower-is-better metrics (timing, etc.):
+    positive change = regression, negative change = improvement."""
+    if change_percent > tolerance_percent:
+        return MetricChange.REGRESSION
+    if change_percent < -tolerance_percent:
+        return MetricChange.IMPROVEMENT
+    return MetricChange.UNCHANGED
+
+
+def _classify_higher_is_better(change_percent: float, tolerance_percent: float) -> MetricChange:
+    """Classify for higher-is-better metrics (throughput, etc.):
+    positive change = improvement, negative change = regression."""
+    if change_percent < -tolerance_percent:
+        return MetricChange.REGRESSION
+    if change_percent > tolerance_percent:
+        return MetricChange.IMPROVEMENT
+    return MetricChange.UNCHANGED
+
+
 def classify_change(
     change_percent: float,
     tolerance: float,
@@ -226,32 +271,15 @@ def classify_change(
     Returns:
         MetricChange classification.
     """
-    tolerance_percent = tolerance * 100.0
-
-    if lower_is_better:
-        # For lower-is-better metrics (timing, etc.):
-        # Positive change = regression (value increased)
-        # Negative change = improvement (value decreased)
-        if change_percent > tolerance_percent:
-            return MetricChange.REGRESSION
-        elif change_percent < -tolerance_percent:
-            return MetricChange.IMPROVEMENT
-    else:
-        # For higher-is-better metrics (throughput, etc.):
-        # Positive change = improvement (value increased)
-        # Negative change = regression (value decreased)
-        if change_percent < -tolerance_percent:
-            return MetricChange.REGRESSION
-        elif change_percent > tolerance_percent:
-            return MetricChange.IMPROVEMENT
-
-    return MetricChange.UNCHANGED
+    classifier = _classify_lower_is_better if lower_is_better else _classify_higher_is_better
+    return classifier(change_percent, tolerance * 100.0)
 
 
 def compare_benchmarks(
     baseline: Path,
     current: Path,
-    tolerance: float = 0.10
+    tolerance: float = 0.10,
+    collect_details: bool = True
 ) -> ComparisonResult:
     """Compare two benchmark runs and identify regressions.
 
@@ -260,6 +288,9 @@ def compare_benchmarks(
         current: Path to the current benchmark JSON file.
         tolerance: Tolerance as a decimal (0.10 = 10%). Metrics that change
                    more than this amount are flagged.
+        collect_details: When False, only the classification counters are
+                         maintained and no MetricComparison lists are built —
+                         for callers that just need has_regressions.
 
     Returns:
         ComparisonResult with all metric comparisons and regression/improvement lists.
@@ -267,16 +298,14 @@ def compare_benchmarks(
     baseline_data = load_benchmark_file(baseline)
     current_data = load_benchmark_file(current)
 
-    # Extract metrics from both files
-    baseline_summary = extract_summary_metrics(baseline_data)
-    current_summary = extract_summary_metrics(current_data)
+    # Extract metrics from both files, merging in place: update() extends
+    # the summary dict with the per-benchmark metrics instead of copying
+    # both intermediate dicts into a third.
+    baseline_metrics = extract_summary_metrics(baseline_data)
+    baseline_metrics.update(extract_benchmark_metrics(baseline_data))
 
-    baseline_benchmarks = extract_benchmark_metrics(baseline_data)
-    current_benchmarks = extract_benchmark_metrics(current_data)
-
-    # Merge all metrics
-    baseline_metrics = {**baseline_summary, **baseline_benchmarks}
-    current_metrics = {**current_summary, **current_benchmarks}
+    current_metrics = extract_summary_metrics(current_data)
+    current_metrics.update(extract_benchmark_metrics(current_data))
 
     result = ComparisonResult(
         baseline_file=baseline,
@@ -284,8 +313,18 @@ def compare_benchmarks(
         tolerance=tolerance
     )
 
-    # Compare metrics that exist in both runs
-    common_metrics = set(baseline_metrics.keys()) & set(current_metrics.keys())
+    # Compare metrics that exist in both runs. Dict key views intersect
+    # directly without materializing two throwaway sets, and the bound
+    # appends are hoisted out of the loop so each metric costs a fixed
+    # number of lookups.
+    common_metrics = baseline_metrics.keys() & current_metrics.keys()
+
+    metrics_append = result.metrics.append
+    regressions_append = result.regressions.append
+    improvements_append = result.improvements.append
+
+    # Converted to percent once here rather than on every classify call.
+    tolerance_percent = tolerance * 100.0
 
     for metric_name in sorted(common_metrics):
         baseline_value, unit, lower_is_better = baseline_metrics[metric_name]
@@ -294,7 +333,18 @@ def compare_benchmarks(
         change_percent = calculate_change_percent(
             baseline_value, current_value, lower_is_better
         )
-        change_type = classify_change(change_percent, tolerance, lower_is_better)
+        classifier = _classify_lower_is_better if lower_is_better else _classify_higher_is_better
+        change_type = classifier(change_percent, tolerance_percent)
+
+        if change_type == MetricChange.REGRESSION:
+            result.regression_count += 1
+        elif change_type == MetricChange.IMPROVEMENT:
+            result.improvement_count += 1
+        else:
+            result.unchanged_count += 1
+
+        if not collect_details:
+            continue
 
         comparison = MetricComparison(
             name=metric_name,
@@ -306,12 +356,12 @@ def compare_benchmarks(
             lower_is_better=lower_is_better
         )
 
-        result.metrics.append(comparison)
+        metrics_append(comparison)
 
         if change_type == MetricChange.REGRESSION:
-            result.regressions.append(comparison)
+            regressions_append(comparison)
         elif change_type == MetricChange.IMPROVEMENT:
-            result.improvements.append(comparison)
+            improvements_append(comparison)
 
     return result
 
@@ -345,6 +395,28 @@ def generate_comparison_report(result: ComparisonResult) -> str:
     Returns:
         Markdown-formatted report string.
     """
+    # A regressed or improved metric appears in two tables; format its
+    # values once and reuse the strings on the second appearance.
+    fmt_cache: Dict[int, tuple] = {}
+
+    def row(metric: MetricComparison, prefix: str = "") -> str:
+        formatted = fmt_cache.get(id(metric))
+        if formatted is None:
+            formatted = (
+                format_value(metric.baseline_value, metric.unit),
+                format_value(metric.current_value, metric.unit),
+            )
+            fmt_cache[id(metric)] = formatted
+        baseline_str, current_str = formatted
+        change_sign = "+" if metric.change_percent > 0 else ""
+        return (
+            f"|{prefix} {metric.name} | {baseline_str} | {current_str} | "
+            f"{change_sign}{metric.change_percent:.1f}% |"
+        )
+
+    # Each table body is emitted as one joined block instead of one
+    # lines.append call per metric, so the builder list stays small no
+    # matter how many metrics were compared.
     lines = [
         "# Benchmark Comparison Report",
         "",
@@ -356,11 +428,10 @@ def generate_comparison_report(result: ComparisonResult) -> str:
 
     # Summary section
     if result.has_regressions:
-        lines.append(f"## Summary: {len(result.regressions)} Regression(s) Detected")
-        lines.append("")
+        lines.append(f"## Summary: {result.regression_count} Regression(s) Detected")
     else:
         lines.append("## Summary: No Regressions Detected")
-        lines.append("")
+    lines.append("")
 
     # Regressions table
     if result.regressions:
@@ -368,15 +439,7 @@ def generate_comparison_report(result: ComparisonResult) -> str:
         lines.append("")
         lines.append("| Metric | Baseline | Current | Change |")
         lines.append("|--------|----------|---------|--------|")
-
-        for metric in result.regressions:
-            baseline_str = format_value(metric.baseline_value, metric.unit)
-            current_str = format_value(metric.current_value, metric.unit)
-            change_sign = "+" if metric.change_percent > 0 else ""
-            lines.append(
-                f"| {metric.name} | {baseline_str} | {current_str} | "
-                f"{change_sign}{metric.change_percent:.1f}% |"
-            )
+        lines.append("\n".join(row(metric) for metric in result.regressions))
         lines.append("")
 
     # Improvements table
@@ -385,39 +448,22 @@ def generate_comparison_report(result: ComparisonResult) -> str:
         lines.append("")
         lines.append("| Metric | Baseline | Current | Change |")
         lines.append("|--------|----------|---------|--------|")
-
-        for metric in result.improvements:
-            baseline_str = format_value(metric.baseline_value, metric.unit)
-            current_str = format_value(metric.current_value, metric.unit)
-            change_sign = "+" if metric.change_percent > 0 else ""
-            lines.append(
-                f"| {metric.name} | {baseline_str} | {current_str} | "
-                f"{change_sign}{metric.change_percent:.1f}% |"
-            )
+        lines.append("\n".join(row(metric) for metric in result.improvements))
         lines.append("")
 
     # All metrics table
+    status_labels = {
+        MetricChange.REGRESSION: " Regression |",
+        MetricChange.IMPROVEMENT: " Improvement |",
+        MetricChange.UNCHANGED: " Unchanged |",
+    }
     lines.append("### All Metrics")
     lines.append("")
     lines.append("| Status | Metric | Baseline | Current | Change |")
     lines.append("|--------|--------|----------|---------|--------|")
-
-    for metric in result.metrics:
-        if metric.change_type == MetricChange.REGRESSION:
-            status = "Regression"
-        elif metric.change_type == MetricChange.IMPROVEMENT:
-            status = "Improvement"
-        else:
-            status = "Unchanged"
-
-        baseline_str = format_value(metric.baseline_value, metric.unit)
-        current_str = format_value(metric.current_value, metric.unit)
-        change_sign = "+" if metric.change_percent > 0 else ""
-
-        lines.append(
-            f"| {status} | {metric.name} | {baseline_str} | {current_str} | "
-            f"{change_sign}{metric.change_percent:.1f}% |"
-        )
+    lines.append(
+        "\n".join(row(metric, status_labels[metric.change_type]) for metric in result.metrics)
+    )
 
     lines.append("")
 
@@ -466,12 +512,11 @@ def print_console_summary(result: ComparisonResult) -> None:
 
     # Summary
     print("=" * 60)
-    total = len(result.metrics)
-    unchanged = total - len(result.regressions) - len(result.improvements)
+    total = result.regression_count + result.improvement_count + result.unchanged_count
     print(f"Total metrics compared: {total}")
-    print(f"  Regressions:   {len(result.regressions)}")
-    print(f"  Improvements:  {len(result.improvements)}")
-    print(f"  Unchanged:     {unchanged}")
+    print(f"  Regressions:   {result.regression_count}")
+    print(f"  Improvements:  {result.improvement_count}")
+    print(f"  Unchanged:     {result.unchanged_count}")
     print()
 
     if result.has_regressions:
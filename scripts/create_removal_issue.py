@@ -11,11 +11,13 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -27,37 +29,113 @@ if sys.platform == "win32":
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
 
+# Example-block patterns used by create_issue_content; compiled once at
+# module scope instead of per issue.
+_BEFORE_RE = re.compile(r'### Before \(Deprecated\)\n```rust\n(.*?)\n```', re.DOTALL)
+_AFTER_RE = re.compile(r'### After \(New API\)\n```rust\n(.*?)\n```', re.DOTALL)
+
+# One pass over the template replaces every [ALL_CAPS] placeholder plus the
+# migration-guide link; unknown tokens are left untouched.
+_PLACEHOLDER_RE = re.compile(r'\[([A-Z_]+)\]|\[Link to migration documentation\]')
+
+# Unchecked checkbox lines; group 1 is the bold label used to decide
+# whether the box should be ticked.
+_CHECKBOX_RE = re.compile(r'- \[ \] \*\*([^*]+)\*\*')
+
+# Breaking-change scope classification: one case-insensitive regex scan
+# per rule instead of a lowercased-copy substring probe per keyword. An
+# API can land in several scopes.
+_SCOPE_RULES = (
+    ("Public API", re.compile(r'config|settings|telemetry', re.IGNORECASE)),
+    ("Plugin ABI", re.compile(r'plugin|abi|frame', re.IGNORECASE)),
+    ("Configuration", re.compile(r'config|settings|filter', re.IGNORECASE)),
+)
+
+
+@functools.lru_cache(maxsize=512)
+def generate_search_pattern(api_name: str) -> str:
+    """Generate regex pattern for searching API usage.
+
+    Memoized because API names repeat across config entries in batch runs.
+    """
+    # Convert API name to search pattern
+    if "::" in api_name:
+        # Method or associated function
+        parts = api_name.split("::")
+        if len(parts) == 2:
+            type_name, method_name = parts
+            return f"\\b{re.escape(method_name)}\\b|\\b{re.escape(type_name)}::{re.escape(method_name)}\\b"
+    elif "." in api_name and not api_name.startswith("."):
+        # Field access
+        field_name = api_name.split(".")[-1]
+        return f"\\.{re.escape(field_name)}\\b"
+    else:
+        # Simple identifier
+        return f"\\b{re.escape(api_name)}\\b"
+
+
+# Before/after example snippets matched against the API name in order:
+# (api-name substring, optional replacement predicate, before, after).
+_EXAMPLE_RULES = (
+    # Simple field access examples
+    ("temp_c", None,
+     "let temp = telemetry.temp_c;",
+     "let temp = telemetry.temperature_c;"),
+    ("wheel_angle_mdeg", None,
+     "let angle = telemetry.wheel_angle_mdeg;",
+     "let angle = telemetry.wheel_angle_deg;"),
+    ("faults", lambda replacement: "fault_flags" in replacement,
+     "let faults = telemetry.faults;",
+     "let fault_flags = telemetry.fault_flags;"),
+    ("sequence", None,
+     "let seq = telemetry.sequence;",
+     "// sequence field removed - use timestamp_us for ordering"),
+    # Constructor examples
+    ("create_device_id", None,
+     'let device = create_device_id("wheel-1".to_string());',
+     'let device = DeviceId::from_str("wheel-1")?;'),
+    ("DeviceId::new", None,
+     'let device = DeviceId::new("wheel-1".to_string());',
+     'let device = DeviceId::from_str("wheel-1")?;'),
+    # Async pattern examples
+    ("BoxFuture", None,
+     "fn method(&self) -> BoxFuture<'_, Result<T, E>>;",
+     "#[async_trait]\nfn method(&self) -> Result<T, E>;"),
+    ("impl Future", None,
+     "fn method(&self) -> impl Future<Output = Result<T, E>>;",
+     "#[async_trait]\nfn method(&self) -> Result<T, E>;"),
+    # API pattern examples
+    ("glob_reexport", None,
+     "pub use racing_wheel_schemas::*;",
+     "use racing_wheel_schemas::prelude::*;"),
+    ("private_import", None,
+     "use racing_wheel_service::internal::Helper;",
+     "use racing_wheel_service::Helper;"),
+)
+
+
 class RemovalIssueCreator:
     """Creates GitHub issues for deprecated API removal tracking."""
     
     def __init__(self, workspace_root: Path):
         self.workspace_root = workspace_root
         self.template_path = workspace_root / ".github" / "ISSUE_TEMPLATE" / "remove_deprecated_api.md"
+        # The template is a pure read of a stable input: load it once here
+        # instead of paying stat + open + read per issue in batch runs.
+        # read_text raises FileNotFoundError with the path on its own, so
+        # no separate exists() probe is needed.
+        self._template = self.template_path.read_text()
+        # Labels attached to every removal issue; copied per issue since
+        # category labels get appended.
+        self._labels_base = ("breaking-change", "deprecation", "technical-debt")
         
     def load_template(self) -> str:
-        """Load the issue template."""
-        if not self.template_path.exists():
-            raise FileNotFoundError(f"Template not found: {self.template_path}")
-            
-        with open(self.template_path, 'r') as f:
-            return f.read()
+        """Return the issue template loaded at construction."""
+        return self._template
             
     def generate_search_pattern(self, api_name: str) -> str:
-        """Generate regex pattern for searching API usage."""
-        # Convert API name to search pattern
-        if "::" in api_name:
-            # Method or associated function
-            parts = api_name.split("::")
-            if len(parts) == 2:
-                type_name, method_name = parts
-                return f"\\b{re.escape(method_name)}\\b|\\b{re.escape(type_name)}::{re.escape(method_name)}\\b"
-        elif "." in api_name and not api_name.startswith("."):
-            # Field access
-            field_name = api_name.split(".")[-1]
-            return f"\\.{re.escape(field_name)}\\b"
-        else:
-            # Simple identifier
-            return f"\\b{re.escape(api_name)}\\b"
+        """Generate regex pattern for searching API usage (cached module function)."""
+        return generate_search_pattern(api_name)
             
     def estimate_migration_complexity(self, api_name: str, replacement: str) -> str:
         """Estimate migration complexity based on API type and replacement."""
@@ -83,25 +161,9 @@ class RemovalIssueCreator:
             
     def determine_scope(self, api_name: str) -> List[str]:
         """Determine the scope of breaking change."""
-        scopes = []
-        
-        # Check if it's a public API
-        if any(keyword in api_name.lower() for keyword in ["config", "settings", "telemetry"]):
-            scopes.append("Public API")
-            
-        # Check if it affects plugin ABI
-        if any(keyword in api_name.lower() for keyword in ["plugin", "abi", "frame"]):
-            scopes.append("Plugin ABI")
-            
-        # Check if it affects configuration
-        if any(keyword in api_name.lower() for keyword in ["config", "settings", "filter"]):
-            scopes.append("Configuration")
-            
+        scopes = [name for name, pattern in _SCOPE_RULES if pattern.search(api_name)]
         # Default to internal if no specific scope identified
-        if not scopes:
-            scopes.append("Internal only")
-            
-        return scopes
+        return scopes or ["Internal only"]
         
     def create_issue_content(self, 
                            api_name: str,
@@ -138,116 +200,182 @@ class RemovalIssueCreator:
         # Generate example code
         before_example, after_example = self.generate_code_examples(api_name, replacement)
         
-        # Fill in template placeholders
-        content = template.replace("[API_NAME]", api_name)
-        content = content.replace("[DEPRECATED_VERSION]", deprecated_version)
-        content = content.replace("[REMOVE_VERSION]", remove_version)
-        content = content.replace("[X]", str(window))
-        content = content.replace("[SEARCH_PATTERN]", search_pattern)
-        
-        # Add migration guide link if provided
-        if migration_guide:
-            content = content.replace("[Link to migration documentation]", migration_guide)
-        else:
-            content = content.replace("[Link to migration documentation]", "docs/MIGRATION_PATTERNS.md")
+        # Fill in template placeholders in one pass instead of a cascade of
+        # full-template str.replace copies.
+        mapping = {
+            "API_NAME": api_name,
+            "DEPRECATED_VERSION": deprecated_version,
+            "REMOVE_VERSION": remove_version,
+            "X": str(window),
+            "SEARCH_PATTERN": search_pattern,
+        }
+        link = migration_guide if migration_guide else "docs/MIGRATION_PATTERNS.md"
+
+        def substitute(match):
+            key = match.group(1)
+            if key is None:
+                # The literal migration-documentation link alternative
+                return link
+            return mapping.get(key, match.group(0))
+
+        content = _PLACEHOLDER_RE.sub(substitute, template)
             
         # Update code examples
         if before_example and after_example:
             # Find and replace the example code blocks
-            before_block = re.search(r'### Before \(Deprecated\)\n```rust\n(.*?)\n```', content, re.DOTALL)
-            after_block = re.search(r'### After \(New API\)\n```rust\n(.*?)\n```', content, re.DOTALL)
+            before_block = _BEFORE_RE.search(content)
+            after_block = _AFTER_RE.search(content)
             
             if before_block:
                 content = content.replace(before_block.group(1), before_example)
             if after_block:
                 content = content.replace(after_block.group(1), after_example)
                 
-        # Mark appropriate checkboxes based on assessment
-        if migration_complexity == "Automatic":
-            content = content.replace("- [ ] **Automatic**: Can be migrated with find/replace", 
-                                    "- [x] **Automatic**: Can be migrated with find/replace")
-        elif migration_complexity == "Semi-automatic":
-            content = content.replace("- [ ] **Semi-automatic**: Requires simple code changes",
-                                    "- [x] **Semi-automatic**: Requires simple code changes")
-        else:
-            content = content.replace("- [ ] **Manual**: Requires significant refactoring",
-                                    "- [x] **Manual**: Requires significant refactoring")
-                                    
-        if risk_level == "Low":
-            content = content.replace("- [ ] **Low**: Simple rename or signature change",
-                                    "- [x] **Low**: Simple rename or signature change")
-        elif risk_level == "Medium":
-            content = content.replace("- [ ] **Medium**: Logic changes but clear migration path",
-                                    "- [x] **Medium**: Logic changes but clear migration path")
-        else:
-            content = content.replace("- [ ] **High**: Complex changes affecting multiple systems",
-                                    "- [x] **High**: Complex changes affecting multiple systems")
-                                    
-        # Mark scope checkboxes
-        for scope in scopes:
-            if scope == "Internal only":
-                content = content.replace("- [ ] **Internal only**: Only affects internal workspace code",
-                                        "- [x] **Internal only**: Only affects internal workspace code")
-            elif scope == "Public API":
-                content = content.replace("- [ ] **Public API**: Affects external consumers (requires major version bump)",
-                                        "- [x] **Public API**: Affects external consumers (requires major version bump)")
-            elif scope == "Plugin ABI":
-                content = content.replace("- [ ] **Plugin ABI**: Affects plugin compatibility",
-                                        "- [x] **Plugin ABI**: Affects plugin compatibility")
-            elif scope == "Configuration":
-                content = content.replace("- [ ] **Configuration**: Affects config file formats",
-                                        "- [x] **Configuration**: Affects config file formats")
+        # Mark appropriate checkboxes based on assessment: the complexity,
+        # risk, and scope names match the bold labels in the template, so a
+        # single pass over the unchecked boxes ticks the selected ones.
+        checked_labels = {migration_complexity, risk_level, *scopes}
+        content = _CHECKBOX_RE.sub(
+            lambda m: m.group(0).replace("[ ]", "[x]", 1) if m.group(1) in checked_labels else m.group(0),
+            content,
+        )
         
         return content
         
     def generate_code_examples(self, api_name: str, replacement: str) -> tuple[str, str]:
-        """Generate before/after code examples."""
+        """Generate before/after code examples.
+
+        Rules are matched in table order; the faults entry additionally
+        requires fault_flags in the replacement, expressed as a predicate
+        on the rule so the chain keeps scanning when it does not hold.
+        """
+        for token, predicate, before, after in _EXAMPLE_RULES:
+            if token in api_name and (predicate is None or predicate(replacement)):
+                return before, after
         
-        # Simple field access examples
-        if "temp_c" in api_name:
-            before = "let temp = telemetry.temp_c;"
-            after = "let temp = telemetry.temperature_c;"
-        elif "wheel_angle_mdeg" in api_name:
-            before = "let angle = telemetry.wheel_angle_mdeg;"
-            after = "let angle = telemetry.wheel_angle_deg;"
-        elif "faults" in api_name and "fault_flags" in replacement:
-            before = "let faults = telemetry.faults;"
-            after = "let fault_flags = telemetry.fault_flags;"
-        elif "sequence" in api_name:
-            before = "let seq = telemetry.sequence;"
-            after = "// sequence field removed - use timestamp_us for ordering"
-            
-        # Constructor examples
-        elif "create_device_id" in api_name:
-            before = 'let device = create_device_id("wheel-1".to_string());'
-            after = 'let device = DeviceId::from_str("wheel-1")?;'
-        elif "DeviceId::new" in api_name:
-            before = 'let device = DeviceId::new("wheel-1".to_string());'
-            after = 'let device = DeviceId::from_str("wheel-1")?;'
-            
-        # Async pattern examples
-        elif "BoxFuture" in api_name:
-            before = "fn method(&self) -> BoxFuture<'_, Result<T, E>>;"
-            after = "#[async_trait]\nfn method(&self) -> Result<T, E>;"
-        elif "impl Future" in api_name:
-            before = "fn method(&self) -> impl Future<Output = Result<T, E>>;"
-            after = "#[async_trait]\nfn method(&self) -> Result<T, E>;"
-            
-        # API pattern examples
-        elif "glob_reexport" in api_name:
-            before = "pub use racing_wheel_schemas::*;"
-            after = "use racing_wheel_schemas::prelude::*;"
-        elif "private_import" in api_name:
-            before = "use racing_wheel_service::internal::Helper;"
-            after = "use racing_wheel_service::Helper;"
-            
-        else:
-            # Generic example
-            before = f"// Example usage of {api_name}"
-            after = f"// Use {replacement} instead"
-            
-        return before, after
+        # Generic example
+        return f"// Example usage of {api_name}", f"// Use {replacement} instead"
         
+    def _save_issue_fallback(self, title: str, content: str, api_name: str) -> None:
+        """Write issue content to a file when GitHub creation fails."""
+        filename = f"removal_issue_{api_name.replace('::', '_').replace('.', '_')}.md"
+        filepath = self.workspace_root / filename
+        with open(filepath, 'w') as f:
+            f.write(f"# {title}\n\n{content}")
+        print(f"💾 Issue content saved to {filepath}")
+
+    def _graphql(self, query: str, **fields) -> Dict:
+        """Run a GraphQL query/mutation through gh api and parse the reply."""
+        cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+        for key, value in fields.items():
+            cmd.extend(["-f", f"{key}={value}"])
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)
+
+    def create_github_issues_bulk(self, issues: List[tuple]) -> bool:
+        """Create many issues with chunked GraphQL mutations.
+
+        One gh api graphql call carries up to 20 aliased createIssue
+        mutations, so a 50-API rollout costs 3 process spawns and HTTPS
+        round-trips instead of 50. The repository id and label ids are
+        looked up once up front. Falls back to the per-issue gh path if
+        the batch setup or a chunk fails.
+
+        Args:
+            issues: List of (api_name, title, body, labels) tuples.
+        """
+        if not issues:
+            return True
+
+        try:
+            repo_info = subprocess.run(
+                ["gh", "repo", "view", "--json", "owner,name"],
+                capture_output=True, text=True, check=True
+            )
+            info = json.loads(repo_info.stdout)
+            data = self._graphql(
+                'query($owner: String!, $name: String!) {'
+                ' repository(owner: $owner, name: $name) {'
+                ' id labels(first: 100) { nodes { id name } } } }',
+                owner=info["owner"]["login"], name=info["name"]
+            )
+            repository = data["data"]["repository"]
+            repository_id = repository["id"]
+            label_ids = {node["name"]: node["id"] for node in repository["labels"]["nodes"]}
+        except (subprocess.CalledProcessError, FileNotFoundError,
+                KeyError, json.JSONDecodeError) as e:
+            print(f"⚠️ GraphQL batch setup failed ({e}); creating issues individually")
+            return self._create_issues_individually(issues)
+
+        all_ok = True
+        batch_size = 20
+        for start in range(0, len(issues), batch_size):
+            chunk = issues[start:start + batch_size]
+            declarations = []
+            mutations = []
+            fields = {}
+            for i, (api_name, title, body, labels) in enumerate(chunk):
+                declarations.append(f"$title{i}: String!, $body{i}: String!")
+                ids = json.dumps([label_ids[l] for l in labels if l in label_ids])
+                mutations.append(
+                    f'i{i}: createIssue(input: {{repositoryId: "{repository_id}", '
+                    f'title: $title{i}, body: $body{i}, labelIds: {ids}}}) '
+                    '{ issue { url } }'
+                )
+                fields[f"title{i}"] = title
+                fields[f"body{i}"] = body
+
+            query = f"mutation({', '.join(declarations)}) {{ {' '.join(mutations)} }}"
+            try:
+                data = self._graphql(query, **fields)
+            except subprocess.CalledProcessError as e:
+                # gh exits non-zero whenever the response carries GraphQL
+                # errors, but it still prints the body; salvage it so the
+                # aliases that did succeed are not re-created as
+                # duplicate issues by the retry below.
+                try:
+                    data = json.loads(e.stdout or "")
+                except json.JSONDecodeError:
+                    data = {}
+            except json.JSONDecodeError:
+                data = {}
+
+            results = data.get("data") or {}
+            failed = []
+            for i, issue in enumerate(chunk):
+                created = results.get(f"i{i}") or {}
+                if isinstance(created, dict) and created.get("issue"):
+                    print(f"✅ Created issue: {created['issue']['url']}")
+                else:
+                    failed.append(issue)
+
+            if failed:
+                print(f"⚠️ GraphQL batch left {len(failed)} issue(s) uncreated; creating them individually")
+                if not self._create_issues_individually(failed):
+                    all_ok = False
+
+        return all_ok
+
+    def _create_issues_individually(self, issues: List[tuple]) -> bool:
+        """Create issues one gh call each, a few in flight at a time.
+
+        Fallback for when the GraphQL batch path is unavailable. Each gh
+        invocation mostly blocks on an HTTPS round-trip, so running a
+        bounded pool of them (five, to stay under GitHub's secondary rate
+        limits) turns N sequential round-trips into roughly N/5.
+        """
+        def create_one(issue):
+            api_name, title, body, labels = issue
+            return self.create_github_issue(title, body, labels)
+
+        all_ok = True
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            for issue, ok in zip(issues, executor.map(create_one, issues)):
+                if not ok:
+                    self._save_issue_fallback(issue[1], issue[2], issue[0])
+                    all_ok = False
+        return all_ok
+
     def create_github_issue(self, title: str, body: str, labels: List[str]) -> bool:
         """Create GitHub issue using gh CLI."""
         try:
@@ -281,8 +409,13 @@ class RemovalIssueCreator:
                            replacement: str = "",
                            migration_guide: str = "",
                            category: str = "",
-                           create_github: bool = True) -> str:
-        """Create a removal issue for a deprecated API."""
+                           create_github: bool = True,
+                           collect_to: Optional[List] = None) -> str:
+        """Create a removal issue for a deprecated API.
+
+        When collect_to is given, the rendered issue is appended to it for
+        later bulk creation instead of being submitted immediately.
+        """
         
         # Generate issue content
         content = self.create_issue_content(
@@ -298,20 +431,17 @@ class RemovalIssueCreator:
         title = f"Remove deprecated API: {api_name} in v{remove_version}"
         
         # Labels
-        labels = ["breaking-change", "deprecation", "technical-debt"]
+        labels = [*self._labels_base]
         if category:
             labels.append(f"category:{category}")
             
         # Create GitHub issue if requested
         if create_github:
-            success = self.create_github_issue(title, content, labels)
-            if not success:
+            if collect_to is not None:
+                collect_to.append((api_name, title, content, labels))
+            elif not self.create_github_issue(title, content, labels):
                 # Save to file as fallback
-                filename = f"removal_issue_{api_name.replace('::', '_').replace('.', '_')}.md"
-                filepath = self.workspace_root / filename
-                with open(filepath, 'w') as f:
-                    f.write(f"# {title}\n\n{content}")
-                print(f"💾 Issue content saved to {filepath}")
+                self._save_issue_fallback(title, content, api_name)
         else:
             print(f"Title: {title}")
             print(f"Labels: {', '.join(labels)}")
@@ -353,6 +483,10 @@ def main():
         # Process multiple APIs from config file
         try:
             apis = load_config(args.config)
+            # Render every issue first, then create them in bulk so the
+            # whole batch costs a couple of gh invocations instead of one
+            # process spawn and HTTPS round-trip per API.
+            pending: List[tuple] = []
             for api_config in apis:
                 print(f"\nProcessing {api_config['api']}...")
                 creator.create_removal_issue(
@@ -362,8 +496,10 @@ def main():
                     replacement=api_config.get("replacement", ""),
                     migration_guide=api_config.get("migration_guide", ""),
                     category=api_config.get("category", ""),
-                    create_github=not args.dry_run
+                    create_github=not args.dry_run,
+                    collect_to=None if args.dry_run else pending
                 )
+            creator.create_github_issues_bulk(pending)
         except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
             print(f"Error loading config: {e}")
             sys.exit(1)
@@ -21,51 +21,58 @@ CAR_STATUS_ENTRY_SIZE = 55
 HEADER_SIZE = 29
 
 
+# Record layouts compiled once: a single .pack per record replaces dozens
+# of per-field struct.pack calls (each of which re-parses its format
+# string and allocates a small bytes object). Struct.size is asserted
+# against the documented record sizes at import time.
+_HEADER = struct.Struct('<HBBBBBQfIIBB')
+_CAR_TELEMETRY = struct.Struct('<HfffBbHBBH4H4B4BH4f4B')
+_CAR_STATUS = struct.Struct('<BBBBBfffHHBBHBBBbfffBfffB')
+
+assert _HEADER.size == HEADER_SIZE, f"Header {_HEADER.size} != {HEADER_SIZE}"
+assert _CAR_TELEMETRY.size == CAR_TELEMETRY_ENTRY_SIZE, \
+    f"Telem entry {_CAR_TELEMETRY.size} != {CAR_TELEMETRY_ENTRY_SIZE}"
+assert _CAR_STATUS.size == CAR_STATUS_ENTRY_SIZE, \
+    f"Status entry {_CAR_STATUS.size} != {CAR_STATUS_ENTRY_SIZE}"
+
+# Shared zero-filled entries for the non-player car slots; bytes are
+# immutable, so one buffer per layout serves every packet.
+_ZERO_TELEM = bytes(CAR_TELEMETRY_ENTRY_SIZE)
+_ZERO_STATUS = bytes(CAR_STATUS_ENTRY_SIZE)
+
+
 def build_header(packet_id, player_index):
-    buf = bytearray()
-    buf += struct.pack('<H', PACKET_FORMAT)
-    buf += struct.pack('<B', GAME_YEAR)
-    buf += struct.pack('<B', MAJOR_VER)
-    buf += struct.pack('<B', MINOR_VER)
-    buf += struct.pack('<B', PACKET_VER)
-    buf += struct.pack('<B', packet_id)
-    buf += struct.pack('<Q', 0xDEADBEEFCAFE0000)
-    buf += struct.pack('<f', 12.345)
-    buf += struct.pack('<I', 42)
-    buf += struct.pack('<I', 42)
-    buf += struct.pack('<B', player_index)
-    buf += struct.pack('<B', 255)
-    assert len(buf) == HEADER_SIZE, f"Header {len(buf)} != {HEADER_SIZE}"
-    return bytes(buf)
+    return _HEADER.pack(
+        PACKET_FORMAT,
+        GAME_YEAR,
+        MAJOR_VER,
+        MINOR_VER,
+        PACKET_VER,
+        packet_id,
+        0xDEADBEEFCAFE0000,
+        12.345,
+        42,
+        42,
+        player_index,
+        255,
+    )
 
 
 def build_car_telemetry_entry(speed_kmh, throttle, steer, brake, clutch, gear,
                                engine_rpm, drs, tyres_pressure,
                                engine_temp, tyres_surface_temp, tyres_inner_temp):
-    buf = bytearray()
-    buf += struct.pack('<H', speed_kmh)
-    buf += struct.pack('<f', throttle)
-    buf += struct.pack('<f', steer)
-    buf += struct.pack('<f', brake)
-    buf += struct.pack('<B', clutch)
-    buf += struct.pack('<b', gear)
-    buf += struct.pack('<H', engine_rpm)
-    buf += struct.pack('<B', drs)
-    buf += struct.pack('<B', 65)
-    buf += struct.pack('<H', 0x0FFF)
-    for t in [400, 380, 350, 360]:
-        buf += struct.pack('<H', t)
-    for t in tyres_surface_temp:
-        buf += struct.pack('<B', t)
-    for t in tyres_inner_temp:
-        buf += struct.pack('<B', t)
-    buf += struct.pack('<H', engine_temp)
-    for p in tyres_pressure:
-        buf += struct.pack('<f', p)
-    for _ in range(4):
-        buf += struct.pack('<B', 1)
-    assert len(buf) == CAR_TELEMETRY_ENTRY_SIZE, f"Telem entry {len(buf)} != {CAR_TELEMETRY_ENTRY_SIZE}"
-    return bytes(buf)
+    return _CAR_TELEMETRY.pack(
+        speed_kmh, throttle, steer, brake, clutch, gear,
+        engine_rpm, drs,
+        65,               # revLightsPercent
+        0x0FFF,           # revLightsBitValue
+        400, 380, 350, 360,  # brakesTemperature
+        *tyres_surface_temp,
+        *tyres_inner_temp,
+        engine_temp,
+        *tyres_pressure,
+        1, 1, 1, 1,       # surfaceType
+    )
 
 
 def build_car_status_entry(pit_limiter, fuel_in_tank, fuel_capacity,
@@ -73,34 +80,33 @@ def build_car_status_entry(pit_limiter, fuel_in_tank, fuel_capacity,
                             drs_allowed, actual_tyre_compound, visual_tyre_compound,
                             tyre_age_laps, engine_power_ice, engine_power_mguk,
                             ers_store_energy, ers_deploy_mode):
-    buf = bytearray()
-    buf += struct.pack('<B', 1)              # 0  tractionControl
-    buf += struct.pack('<B', 1)              # 1  antiLockBrakes
-    buf += struct.pack('<B', 0)              # 2  fuelMix
-    buf += struct.pack('<B', 56)             # 3  frontBrakeBias
-    buf += struct.pack('<B', pit_limiter)    # 4  pitLimiterStatus
-    buf += struct.pack('<f', fuel_in_tank)   # 5  fuelInTank
-    buf += struct.pack('<f', fuel_capacity)  # 9  fuelCapacity
-    buf += struct.pack('<f', fuel_remaining_laps)  # 13 fuelRemainingLaps
-    buf += struct.pack('<H', max_rpm)        # 17 maxRPM
-    buf += struct.pack('<H', idle_rpm)       # 19 idleRPM
-    buf += struct.pack('<B', 8)              # 21 maxGears
-    buf += struct.pack('<B', drs_allowed)    # 22 drsAllowed
-    buf += struct.pack('<H', 0)              # 23 drsActivationDistance
-    buf += struct.pack('<B', actual_tyre_compound)  # 25 actualTyreCompound
-    buf += struct.pack('<B', visual_tyre_compound)  # 26 visualTyreCompound
-    buf += struct.pack('<B', tyre_age_laps)  # 27 tyresAgeLaps
-    buf += struct.pack('<b', 0)              # 28 vehicleFiaFlags (signed)
-    buf += struct.pack('<f', engine_power_ice)    # 29 enginePowerICE
-    buf += struct.pack('<f', engine_power_mguk)   # 33 enginePowerMGUK
-    buf += struct.pack('<f', ers_store_energy)    # 37 ersStoreEnergy
-    buf += struct.pack('<B', ers_deploy_mode)     # 41 ersDeployMode
-    buf += struct.pack('<f', 0.0)            # 42 ersHarvestedThisLapMGUK
-    buf += struct.pack('<f', 0.0)            # 46 ersHarvestedThisLapMGUH
-    buf += struct.pack('<f', 0.0)            # 50 ersDeployedThisLap
-    buf += struct.pack('<B', 0)              # 54 networkPaused
-    assert len(buf) == CAR_STATUS_ENTRY_SIZE, f"Status entry {len(buf)} != {CAR_STATUS_ENTRY_SIZE}"
-    return bytes(buf)
+    return _CAR_STATUS.pack(
+        1,                    # 0  tractionControl
+        1,                    # 1  antiLockBrakes
+        0,                    # 2  fuelMix
+        56,                   # 3  frontBrakeBias
+        pit_limiter,          # 4  pitLimiterStatus
+        fuel_in_tank,         # 5  fuelInTank
+        fuel_capacity,        # 9  fuelCapacity
+        fuel_remaining_laps,  # 13 fuelRemainingLaps
+        max_rpm,              # 17 maxRPM
+        idle_rpm,             # 19 idleRPM
+        8,                    # 21 maxGears
+        drs_allowed,          # 22 drsAllowed
+        0,                    # 23 drsActivationDistance
+        actual_tyre_compound,  # 25 actualTyreCompound
+        visual_tyre_compound,  # 26 visualTyreCompound
+        tyre_age_laps,        # 27 tyresAgeLaps
+        0,                    # 28 vehicleFiaFlags (signed)
+        engine_power_ice,     # 29 enginePowerICE
+        engine_power_mguk,    # 33 enginePowerMGUK
+        ers_store_energy,     # 37 ersStoreEnergy
+        ers_deploy_mode,      # 41 ersDeployMode
+        0.0,                  # 42 ersHarvestedThisLapMGUK
+        0.0,                  # 46 ersHarvestedThisLapMGUH
+        0.0,                  # 50 ersDeployedThisLap
+        0,                    # 54 networkPaused
+    )
 
 
 def main():
@@ -127,12 +133,17 @@ def main():
         tyres_inner_temp=[95, 92, 88, 90],
     )
 
-    cars_data = bytearray()
-    for i in range(NUM_CARS):
-        cars_data += player_telem if i == player_index else bytes(CAR_TELEMETRY_ENTRY_SIZE)
+    # Two runs of zero-filled entries around the player slot; bytes
+    # multiplication builds the 22-car block in C instead of a Python
+    # loop of bytearray extends.
+    cars_data = (_ZERO_TELEM * player_index
+                 + player_telem
+                 + _ZERO_TELEM * (NUM_CARS - 1 - player_index))
 
     trailer = struct.pack('<BBb', 0, 0, 7)
-    telem_packet = header + bytes(cars_data) + trailer
+    # join allocates the final packet once instead of an intermediate
+    # header+cars copy followed by the trailer append.
+    telem_packet = b''.join((header, cars_data, trailer))
     assert len(telem_packet) == 29 + 22 * 60 + 3, f"Unexpected size {len(telem_packet)}"
 
     path = os.path.join(out_dir, 'car_telemetry_packet.bin')
@@ -160,11 +171,11 @@ def main():
         ers_deploy_mode=2,
     )
 
-    cars_status = bytearray()
-    for i in range(NUM_CARS):
-        cars_status += player_status if i == player_index else bytes(CAR_STATUS_ENTRY_SIZE)
+    cars_status = (_ZERO_STATUS * player_index
+                   + player_status
+                   + _ZERO_STATUS * (NUM_CARS - 1 - player_index))
 
-    status_packet = header_status + bytes(cars_status)
+    status_packet = b''.join((header_status, cars_status))
     assert len(status_packet) == 29 + 22 * 55, f"Unexpected size {len(status_packet)}"
 
     path = os.path.join(out_dir, 'car_status_packet.bin')
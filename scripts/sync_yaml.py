@@ -11,12 +11,14 @@ The mirror is:
 Usage:
     python scripts/sync_yaml.py --check   # Exit 1 if files differ (no writes)
     python scripts/sync_yaml.py --fix     # Copy canonical → mirror
+    python scripts/sync_yaml.py --link    # Hardlink mirror to canonical (local dev)
 
 Requires Python 3.8+. No external dependencies.
 """
 
 import argparse
 import difflib
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -25,9 +27,9 @@ CANONICAL = Path("crates/telemetry-config/src/game_support_matrix.yaml")
 MIRROR = Path("crates/telemetry-support/src/game_support_matrix.yaml")
 
 
-def read_lines(path: Path) -> list[str]:
+def read_bytes(path: Path) -> bytes:
     try:
-        return path.read_text(encoding="utf-8").splitlines(keepends=True)
+        return path.read_bytes()
     except FileNotFoundError:
         print(f"ERROR: file not found: {path}", file=sys.stderr)
         sys.exit(2)
@@ -46,6 +48,36 @@ def show_diff(lines_a: list[str], lines_b: list[str]) -> None:
         print(line, file=sys.stderr)
 
 
+def link_mirror() -> int:
+    """Replace the mirror with a hardlink to the canonical file.
+
+    While linked, edits to either path update both, so local edit loops skip
+    the copy step entirely. A `git checkout` that rewrites one path severs
+    the link silently, so CI must keep running --check; if hardlinks are
+    unsupported (filesystem, Windows privileges) we fall back to a copy.
+    """
+    st_canonical = CANONICAL.stat()
+    try:
+        st_mirror = MIRROR.stat()
+        if (st_mirror.st_dev, st_mirror.st_ino) == (st_canonical.st_dev, st_canonical.st_ino):
+            print(f"OK: {MIRROR} is already hardlinked to {CANONICAL}.")
+            return 0
+        MIRROR.unlink()
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.link(CANONICAL, MIRROR)
+    except OSError as exc:
+        print(f"WARNING: hardlink failed ({exc}); copying instead.", file=sys.stderr)
+        shutil.copy2(CANONICAL, MIRROR)
+        print(f"Fixed: copied {CANONICAL} → {MIRROR}")
+        return 0
+
+    print(f"Linked: {MIRROR} → {CANONICAL}")
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Keep game support matrix YAML files in sync.",
@@ -61,21 +93,38 @@ def main() -> int:
         action="store_true",
         help="Copy canonical (telemetry-config) to mirror (telemetry-support).",
     )
+    mode.add_argument(
+        "--link",
+        action="store_true",
+        help="Hardlink mirror to canonical so edits propagate without copying "
+        "(local dev convenience; a git checkout severs the link).",
+    )
     args = parser.parse_args()
 
-    lines_canonical = read_lines(CANONICAL)
-    lines_mirror = read_lines(MIRROR)
+    if args.link:
+        if not CANONICAL.exists():
+            print(f"ERROR: file not found: {CANONICAL}", file=sys.stderr)
+            return 2
+        return link_mirror()
+
+    # Compare raw bytes first: the common no-op case needs no decode,
+    # no line splitting, and (under --fix) no write.
+    raw_canonical = read_bytes(CANONICAL)
+    raw_mirror = read_bytes(MIRROR)
 
-    if lines_canonical == lines_mirror:
+    if raw_canonical == raw_mirror:
         print(f"OK: {CANONICAL} and {MIRROR} are identical.")
         return 0
 
-    # Files differ — report it.
+    # Files differ — report it. Only now split into lines for the diff.
     print("ERROR: game support matrix files are out of sync!", file=sys.stderr)
     print(f"  canonical : {CANONICAL}", file=sys.stderr)
     print(f"  mirror    : {MIRROR}", file=sys.stderr)
     print("", file=sys.stderr)
-    show_diff(lines_canonical, lines_mirror)
+    show_diff(
+        raw_canonical.decode("utf-8").splitlines(keepends=True),
+        raw_mirror.decode("utf-8").splitlines(keepends=True),
+    )
     print("", file=sys.stderr)
 
     if args.check:
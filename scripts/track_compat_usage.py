@@ -436,6 +436,18 @@ class CompatUsageTracker:
         print("\n✅ PASS: Trend analysis complete")
 
 
+def get_usage_count(workspace_root: Optional[Path] = None) -> int:
+    """Return the current total deprecated-API usage count.
+
+    In-process entry point for other scripts: importing this module and
+    calling it directly skips the interpreter startup and stdout scraping
+    that spawning track_compat_usage.py as a subprocess would cost.
+    """
+    tracker = CompatUsageTracker((workspace_root or Path.cwd()).resolve())
+    usage_data = tracker.scan_usage()
+    return sum(len(matches) for matches in usage_data.values())
+
+
 def main():
     parser = argparse.ArgumentParser(description="Track compatibility usage across workspace")
     parser.add_argument("--baseline", action="store_true", help="Create baseline measurement")